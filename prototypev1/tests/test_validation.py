@@ -4,17 +4,34 @@ Advanced validation and benchmarking tests for mbmesh prototype
 Tests glTF file format compliance, data integrity, and performance
 """
 
+import argparse
+import hashlib
+import io
 import json
-import struct
+import mmap
 import os
 import sys
 import time
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# glTF binary buffers are little-endian; build the element types once
+_U32 = np.dtype('<u4')
+_F32 = np.dtype('<f4')
+
 
 class Colors:
-    """ANSI color codes for terminal output"""
+    """ANSI color codes for terminal output (empty when stdout is not a terminal)"""
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
     OKCYAN = '\033[96m'
@@ -23,34 +40,99 @@ class Colors:
     FAIL = '\033[91m'
     ENDC = '\033[0m'
     BOLD = '\033[1m'
+    
+    if not sys.stdout.isatty():
+        HEADER = OKBLUE = OKCYAN = OKGREEN = WARNING = FAIL = ENDC = BOLD = ''
+
+
+# Pre-wrapped message templates, built once
+_HEADER_FMT = f"\n{Colors.HEADER}{Colors.BOLD}=== {{}} ==={Colors.ENDC}"
+_TEST_FMT = f"{Colors.OKCYAN}Testing: {{}}...{Colors.ENDC}"
+_PASS = f"{Colors.OKGREEN}PASSED{Colors.ENDC}"
+_FAIL = f"{Colors.FAIL}FAILED{Colors.ENDC}"
+_ERROR_FMT = f"  {Colors.FAIL}Error: {{}}{Colors.ENDC}"
+
+
+# Per-thread output stream, so concurrently running tests don't interleave
+_output = threading.local()
+
+
+def _out():
+    return getattr(_output, 'stream', sys.stdout)
 
 
 def print_header(text):
-    print(f"\n{Colors.HEADER}{Colors.BOLD}=== {text} ==={Colors.ENDC}")
+    print(_HEADER_FMT.format(text))
 
 
 def print_test(name):
-    print(f"{Colors.OKCYAN}Testing: {name}...{Colors.ENDC}", end=" ")
+    print(_TEST_FMT.format(name), end=" ", file=_out())
 
 
 def print_pass():
-    print(f"{Colors.OKGREEN}PASSED{Colors.ENDC}")
+    print(_PASS, file=_out())
 
 
 def print_fail(msg=""):
-    print(f"{Colors.FAIL}FAILED{Colors.ENDC}")
+    print(_FAIL, file=_out())
     if msg:
-        print(f"  {Colors.FAIL}Error: {msg}{Colors.ENDC}")
+        print(_ERROR_FMT.format(msg), file=_out())
+
+
+def _load_gltf(gltf_path):
+    """Parse the glTF JSON document, using orjson when it is installed"""
+    raw = gltf_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def test_gltf_json_format(gltf_path):
-    """Test that glTF JSON is valid and well-formed"""
+def _load_mesh(gltf, bin_path):
+    """Decode the position and index buffers of a parsed glTF document once"""
+    position_accessor = gltf['accessors'][0]
+    index_accessor = gltf['accessors'][1]
+    
+    position_offset = gltf['bufferViews'][0].get('byteOffset', 0) + position_accessor.get('byteOffset', 0)
+    index_offset = gltf['bufferViews'][1].get('byteOffset', 0) + index_accessor.get('byteOffset', 0)
+    
+    # Check the declared ranges against the file size before reading anything
+    actual_size = bin_path.stat().st_size
+    position_end = position_offset + position_accessor['count'] * 3 * _F32.itemsize
+    index_end = index_offset + index_accessor['count'] * _U32.itemsize
+    
+    if position_end > actual_size:
+        raise ValueError(f"Position data ends at byte {position_end}, file is {actual_size} bytes")
+    if index_end > actual_size:
+        raise ValueError(f"Index data ends at byte {index_end}, file is {actual_size} bytes")
+    
+    # Map the file once; the arrays below are zero-copy views that keep it alive
+    with open(bin_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    positions = np.frombuffer(
+        data, dtype=_F32, count=position_accessor['count'] * 3, offset=position_offset,
+    ).reshape(-1, 3)
+    indices = np.frombuffer(
+        data, dtype=_U32, count=index_accessor['count'], offset=index_offset,
+    )
+    
+    return positions, indices
+
+
+def _run_test(test_func, args):
+    """Run one test with its output buffered, returning (result, output)"""
+    _output.stream = io.StringIO()
+    try:
+        return test_func(*args), _output.stream.getvalue()
+    finally:
+        del _output.stream
+
+
+def test_gltf_json_format(data):
+    """Test that glTF JSON is well-formed"""
     print_test("glTF JSON format validation")
     
     try:
-        with open(gltf_path, 'r') as f:
-            data = json.load(f)
-        
         # Check required top-level fields
         required_fields = ['asset', 'scenes', 'nodes', 'meshes', 
                           'accessors', 'bufferViews', 'buffers']
@@ -68,56 +150,36 @@ def test_gltf_json_format(gltf_path):
         print_pass()
         return True
     
-    except json.JSONDecodeError as e:
-        print_fail(f"Invalid JSON: {e}")
-        return False
     except Exception as e:
         print_fail(str(e))
         return False
 
 
-def test_gltf_accessor_bounds(gltf_path, bin_path):
+def test_gltf_accessor_bounds(gltf, positions):
     """Test that accessor min/max bounds are correct"""
     print_test("Accessor bounds validation")
     
     try:
-        with open(gltf_path, 'r') as f:
-            gltf = json.load(f)
-        
         # Get position accessor
         position_accessor = gltf['accessors'][0]
         
-        # Read binary data
-        with open(bin_path, 'rb') as f:
-            vertex_data = f.read(position_accessor['count'] * 12)  # 3 floats * 4 bytes
-        
-        # Parse vertices
-        vertices = []
-        for i in range(position_accessor['count']):
-            offset = i * 12
-            x, y, z = struct.unpack('fff', vertex_data[offset:offset+12])
-            vertices.append((x, y, z))
-        
         # Calculate actual bounds
-        xs = [v[0] for v in vertices]
-        ys = [v[1] for v in vertices]
-        zs = [v[2] for v in vertices]
-        
-        actual_min = [min(xs), min(ys), min(zs)]
-        actual_max = [max(xs), max(ys), max(zs)]
+        actual_min = positions.min(axis=0)
+        actual_max = positions.max(axis=0)
         
         # Compare with accessor bounds
-        declared_min = position_accessor['min']
-        declared_max = position_accessor['max']
+        declared_min = np.asarray(position_accessor['min'], dtype=_F32)
+        declared_max = np.asarray(position_accessor['max'], dtype=_F32)
         
         epsilon = 0.001
-        for i in range(3):
-            if abs(actual_min[i] - declared_min[i]) > epsilon:
-                print_fail(f"Min bound mismatch at component {i}")
-                return False
-            if abs(actual_max[i] - declared_max[i]) > epsilon:
-                print_fail(f"Max bound mismatch at component {i}")
-                return False
+        if not np.allclose(actual_min, declared_min, rtol=0, atol=epsilon):
+            component = int(np.argmax(np.abs(actual_min - declared_min)))
+            print_fail(f"Min bound mismatch at component {component}")
+            return False
+        if not np.allclose(actual_max, declared_max, rtol=0, atol=epsilon):
+            component = int(np.argmax(np.abs(actual_max - declared_max)))
+            print_fail(f"Max bound mismatch at component {component}")
+            return False
         
         print_pass()
         return True
@@ -127,31 +189,19 @@ def test_gltf_accessor_bounds(gltf_path, bin_path):
         return False
 
 
-def test_triangle_indices_valid(gltf_path, bin_path):
+def test_triangle_indices_valid(gltf, indices):
     """Test that all triangle indices are valid"""
     print_test("Triangle index validation")
     
     try:
-        with open(gltf_path, 'r') as f:
-            gltf = json.load(f)
-        
         vertex_count = gltf['accessors'][0]['count']
-        index_accessor = gltf['accessors'][1]
-        index_count = index_accessor['count']
         
-        # Read index data
-        with open(bin_path, 'rb') as f:
-            f.seek(gltf['bufferViews'][1]['byteOffset'])
-            index_data = f.read(index_count * 4)  # 4 bytes per uint32
+        # Check all indices in one pass
+        bad = np.where(indices >= vertex_count)[0]
         
-        # Check each index
-        for i in range(index_count):
-            offset = i * 4
-            index = struct.unpack('I', index_data[offset:offset+4])[0]
-            
-            if index >= vertex_count:
-                print_fail(f"Index {index} out of range (max: {vertex_count-1})")
-                return False
+        if bad.size:
+            print_fail(f"Index {indices[bad[0]]} out of range (max: {vertex_count-1})")
+            return False
         
         print_pass()
         return True
@@ -161,30 +211,18 @@ def test_triangle_indices_valid(gltf_path, bin_path):
         return False
 
 
-def test_no_degenerate_triangles(gltf_path, bin_path):
+def test_no_degenerate_triangles(indices):
     """Test that no triangles have duplicate vertices"""
     print_test("Degenerate triangle check")
     
     try:
-        with open(gltf_path, 'r') as f:
-            gltf = json.load(f)
-        
-        index_count = gltf['accessors'][1]['count']
-        
-        # Read index data
-        with open(bin_path, 'rb') as f:
-            f.seek(gltf['bufferViews'][1]['byteOffset'])
-            index_data = f.read(index_count * 4)
-        
         # Check triangles (every 3 indices)
-        for i in range(0, index_count, 3):
-            i0 = struct.unpack('I', index_data[i*4:(i+1)*4])[0]
-            i1 = struct.unpack('I', index_data[(i+1)*4:(i+2)*4])[0]
-            i2 = struct.unpack('I', index_data[(i+2)*4:(i+3)*4])[0]
-            
-            if i0 == i1 or i1 == i2 or i2 == i0:
-                print_fail(f"Degenerate triangle at index {i//3}")
-                return False
+        tri = indices.reshape(-1, 3)
+        degen_mask = (tri[:, 0] == tri[:, 1]) | (tri[:, 1] == tri[:, 2]) | (tri[:, 0] == tri[:, 2])
+        
+        if degen_mask.any():
+            print_fail(f"Degenerate triangle at index {int(np.argmax(degen_mask))}")
+            return False
         
         print_pass()
         return True
@@ -194,16 +232,13 @@ def test_no_degenerate_triangles(gltf_path, bin_path):
         return False
 
 
-def test_buffer_size_matches(gltf_path, bin_path):
+def test_buffer_size_matches(gltf, bin_path):
     """Test that binary buffer size matches declaration"""
     print_test("Buffer size consistency")
     
     try:
-        with open(gltf_path, 'r') as f:
-            gltf = json.load(f)
-        
         declared_size = gltf['buffers'][0]['byteLength']
-        actual_size = os.path.getsize(bin_path)
+        actual_size = bin_path.stat().st_size
         
         if declared_size != actual_size:
             print_fail(f"Size mismatch: declared={declared_size}, actual={actual_size}")
@@ -217,43 +252,31 @@ def test_buffer_size_matches(gltf_path, bin_path):
         return False
 
 
-def test_mesh_topology(gltf_path, bin_path):
+def test_mesh_topology(gltf, indices):
     """Test mesh topology and connectivity"""
     print_test("Mesh topology analysis")
     
     try:
-        with open(gltf_path, 'r') as f:
-            gltf = json.load(f)
-        
         vertex_count = gltf['accessors'][0]['count']
-        triangle_count = gltf['accessors'][1]['count'] // 3
+        triangle_count = indices.size // 3
         
-        # Read triangles
-        with open(bin_path, 'rb') as f:
-            f.seek(gltf['bufferViews'][1]['byteOffset'])
-            index_data = f.read(gltf['accessors'][1]['count'] * 4)
+        # Out-of-range indices would silently grow the usage histogram
+        if indices.size and indices.max() >= vertex_count:
+            print_fail(f"Index {indices.max()} out of range (max: {vertex_count-1})")
+            return False
         
         # Build vertex usage map
-        vertex_usage = [0] * vertex_count
-        
-        for i in range(0, gltf['accessors'][1]['count'], 3):
-            i0 = struct.unpack('I', index_data[i*4:(i+1)*4])[0]
-            i1 = struct.unpack('I', index_data[(i+1)*4:(i+2)*4])[0]
-            i2 = struct.unpack('I', index_data[(i+2)*4:(i+3)*4])[0]
-            
-            vertex_usage[i0] += 1
-            vertex_usage[i1] += 1
-            vertex_usage[i2] += 1
+        vertex_usage = np.bincount(indices, minlength=vertex_count)
         
         # Check for unused vertices
-        unused_vertices = sum(1 for u in vertex_usage if u == 0)
+        unused_vertices = int((vertex_usage == 0).sum())
         
         if unused_vertices > 0:
             print_fail(f"{unused_vertices} unused vertices found")
             return False
         
         print_pass()
-        print(f"  {Colors.OKBLUE}Vertices: {vertex_count}, Triangles: {triangle_count}{Colors.ENDC}")
+        print(f"  {Colors.OKBLUE}Vertices: {vertex_count}, Triangles: {triangle_count}{Colors.ENDC}", file=_out())
         return True
     
     except Exception as e:
@@ -261,6 +284,32 @@ def test_mesh_topology(gltf_path, bin_path):
         return False
 
 
+def _compile_benchmark(source_path, binary_path, tmp_dir, train_width, train_length):
+    """Build the benchmark with profile-guided optimization, falling back to a plain build"""
+    base_cmd = ['g++', '-std=c++11', '-O3', '-march=native', '-ffast-math']
+    profile_dir = os.path.join(tmp_dir, 'pgo')
+    
+    try:
+        # Instrument, run on a representative size, then rebuild from the profile
+        subprocess.run(base_cmd + [f'-fprofile-generate={profile_dir}', '-o', binary_path, source_path],
+                      check=True, capture_output=True)
+        subprocess.run([binary_path, str(train_width), str(train_length)],
+                      check=True, capture_output=True)
+        subprocess.run(base_cmd + [f'-fprofile-use={profile_dir}', '-o', binary_path, source_path],
+                      check=True, capture_output=True)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    
+    # Toolchain without GCC-style PGO support
+    try:
+        subprocess.run(base_cmd + ['-o', binary_path, source_path],
+                      check=True, capture_output=True)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
 def benchmark_generation():
     """Benchmark mesh generation performance"""
     print_header("Performance Benchmarks")
@@ -271,91 +320,135 @@ def benchmark_generation():
         (100, 200, "Large"),
     ]
     
-    for width, length, label in test_sizes:
-        print(f"{Colors.OKCYAN}Benchmarking {label} mesh ({width}x{length})...{Colors.ENDC}")
-        
-        # Create temporary test program
-        test_code = f"""
+    # Create temporary test program, sized from the command line
+    test_code = """
+#include <cstdlib>
 #include <iostream>
 #include <vector>
 #include <cmath>
 #include <chrono>
 
-struct Point3D {{ double x, y, z; }};
+struct Point3D { double x, y, z; };
 
-std::vector<Point3D> generateData(int w, int l) {{
+std::vector<Point3D> generateData(int w, int l) {
     std::vector<Point3D> points;
-    for (int i = 0; i < l; i++) {{
-        for (int j = 0; j < w; j++) {{
-            Point3D p;
+    points.resize(static_cast<size_t>(w) * l);
+    
+    // sin(j * 0.3) depends only on the column, cos(i * 0.2) only on the row
+    std::vector<double> sinj(w);
+    for (int j = 0; j < w; j++) {
+        sinj[j] = sin(j * 0.3);
+    }
+    
+    for (int i = 0; i < l; i++) {
+        double ci = cos(i * 0.2);
+        for (int j = 0; j < w; j++) {
+            Point3D& p = points[static_cast<size_t>(i) * w + j];
             p.x = j * 10.0;
             p.y = i * 10.0;
-            p.z = -100.0 + 20.0 * sin(j * 0.3) * cos(i * 0.2);
-            points.push_back(p);
-        }}
-    }}
+            p.z = -100.0 + 20.0 * sinj[j] * ci;
+        }
+    }
     return points;
-}}
-
-int main() {{
+}
+
+int main(int argc, char** argv) {
+    if (argc != 3) {
+        std::cerr << "Usage: " << argv[0] << " <width> <length>" << std::endl;
+        return 1;
+    }
+    int w = atoi(argv[1]);
+    int l = atoi(argv[2]);
+    
     auto start = std::chrono::high_resolution_clock::now();
-    auto data = generateData({width}, {length});
+    auto data = generateData(w, l);
     auto end = std::chrono::high_resolution_clock::now();
     
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
+    auto duration = std::chrono::duration_cast<std::chrono::nanoseconds>(end - start);
     std::cout << duration.count() << std::endl;
     return 0;
-}}
+}
 """
+    
+    # Keep the source and binary in a scratch directory removed in one shot
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = os.path.join(tmp_dir, 'bench_temp.cpp')
+        binary_path = os.path.join(tmp_dir, 'bench_temp')
         
-        with open('bench_temp.cpp', 'w') as f:
+        with open(source_path, 'w') as f:
             f.write(test_code)
         
-        # Compile and run
-        try:
-            subprocess.run(['g++', '-std=c++11', '-O2', '-o', 'bench_temp', 'bench_temp.cpp'],
-                          check=True, capture_output=True)
-            result = subprocess.run(['./bench_temp'], capture_output=True, text=True, check=True)
-            
-            microseconds = int(result.stdout.strip())
-            milliseconds = microseconds / 1000.0
-            
-            vertex_count = width * length
-            triangle_count = (width - 1) * (length - 1) * 2
-            
-            print(f"  Time: {milliseconds:.2f}ms")
-            print(f"  Vertices: {vertex_count:,}, Triangles: {triangle_count:,}")
-            print(f"  Rate: {vertex_count/milliseconds:.0f} vertices/ms")
-            
-            # Cleanup
-            os.remove('bench_temp.cpp')
-            os.remove('bench_temp')
+        # Compile once for all sizes, trained on the medium mesh
+        train_width, train_length, _ = test_sizes[1]
+        if not _compile_benchmark(source_path, binary_path, tmp_dir, train_width, train_length):
+            print(f"  {Colors.WARNING}Benchmark compilation failed{Colors.ENDC}")
+            return
+        
+        for width, length, label in test_sizes:
+            print(f"{Colors.OKCYAN}Benchmarking {label} mesh ({width}x{length})...{Colors.ENDC}")
             
-        except subprocess.CalledProcessError as e:
-            print(f"  {Colors.WARNING}Benchmark failed{Colors.ENDC}")
-
-
-def test_data_integrity():
+            try:
+                result = subprocess.run([binary_path, str(width), str(length)],
+                                      capture_output=True, check=True)
+                
+                nanoseconds = int(result.stdout)
+                milliseconds = nanoseconds / 1e6
+                
+                vertex_count = width * length
+                triangle_count = (width - 1) * (length - 1) * 2
+                
+                print(f"  Time: {milliseconds:.2f}ms")
+                print(f"  Vertices: {vertex_count:,}, Triangles: {triangle_count:,}")
+                print(f"  Rate: {vertex_count/milliseconds:.0f} vertices/ms")
+                
+            except subprocess.CalledProcessError as e:
+                print(f"  {Colors.WARNING}Benchmark failed{Colors.ENDC}")
+
+
+def _file_sha256(path):
+    """SHA-256 hex digest of a file, streamed in C where hashlib.file_digest exists"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def test_data_integrity(prototype, gltf_path, bin_path):
     """Test data integrity and consistency"""
     print_test("Data integrity check")
     
+    output_files = [gltf_path, bin_path]
+    
     try:
-        # Generate a test mesh
-        result = subprocess.run(['./mbmesh_prototype'], 
-                              capture_output=True, text=True, timeout=10)
+        digests = []
         
-        if result.returncode != 0:
-            print_fail("Prototype execution failed")
-            return False
-        
-        # Check output files exist
-        if not os.path.exists('seafloor_mesh.gltf'):
-            print_fail("glTF file not created")
-            return False
+        # Generate the test mesh twice; output must be byte-identical
+        for _ in range(2):
+            result = subprocess.run([prototype.absolute()], 
+                                  capture_output=True, text=True, timeout=10)
+            
+            if result.returncode != 0:
+                print_fail("Prototype execution failed")
+                return False
+            
+            # Check output files exist
+            if not gltf_path.is_file():
+                print_fail("glTF file not created")
+                return False
+            
+            if not bin_path.is_file():
+                print_fail("Binary file not created")
+                return False
+            
+            digests.append([_file_sha256(path) for path in output_files])
         
-        if not os.path.exists('seafloor_mesh.bin'):
-            print_fail("Binary file not created")
-            return False
+        for path, first, second in zip(output_files, *digests):
+            if first != second:
+                print_fail(f"{path} differs between runs (sha256 {first[:12]} != {second[:12]})")
+                return False
         
         print_pass()
         return True
@@ -366,49 +459,90 @@ def test_data_integrity():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate mbmesh prototype output")
+    parser.add_argument('--bench', action='store_true',
+                        help="also compile and run the mesh generation benchmarks")
+    args = parser.parse_args()
+    
     print(f"{Colors.BOLD}")
     print("=" * 60)
     print("  MB-System mbmesh - Python Validation & Benchmark Suite")
     print("=" * 60)
     print(f"{Colors.ENDC}")
     
+    prototype = Path('mbmesh_prototype')
+    gltf_file = Path('seafloor_mesh.gltf')
+    bin_file = Path('seafloor_mesh.bin')
+    
     # Check if prototype exists
-    if not os.path.exists('./mbmesh_prototype'):
+    if not prototype.is_file():
         print(f"{Colors.FAIL}Error: mbmesh_prototype not found. Please compile first.{Colors.ENDC}")
         print("Run: make")
         return 1
     
     # Run prototype to generate test files
     print_header("Generating Test Data")
-    if not test_data_integrity():
+    if not test_data_integrity(prototype, gltf_file, bin_file):
         return 1
     
-    gltf_file = 'seafloor_mesh.gltf'
-    bin_file = 'seafloor_mesh.bin'
-    
     # Run validation tests
     print_header("Format Validation Tests")
     
+    # Parse the glTF document once and share it across all tests
+    gltf_error = None
+    try:
+        gltf = _load_gltf(gltf_file)
+    except OSError as e:
+        gltf_error = f"Cannot read glTF file: {e}"
+    except ValueError as e:
+        gltf_error = f"Invalid JSON: {e}"
+    
+    if gltf_error is not None:
+        print_test("glTF JSON parsing")
+        print_fail(gltf_error)
+        print(f"\n{Colors.FAIL}{Colors.BOLD}Validation aborted: no glTF document to test{Colors.ENDC}\n")
+        return 1
+    
     tests = [
-        (test_gltf_json_format, [gltf_file]),
-        (test_buffer_size_matches, [gltf_file, bin_file]),
-        (test_gltf_accessor_bounds, [gltf_file, bin_file]),
-        (test_triangle_indices_valid, [gltf_file, bin_file]),
-        (test_no_degenerate_triangles, [gltf_file, bin_file]),
-        (test_mesh_topology, [gltf_file, bin_file]),
+        (test_gltf_json_format, [gltf]),
+        (test_buffer_size_matches, [gltf, bin_file]),
     ]
     
+    # Decode the mesh buffers once and share them across the data tests
+    load_error = None
+    try:
+        positions, indices = _load_mesh(gltf, bin_file)
+        tests += [
+            (test_gltf_accessor_bounds, [gltf, positions]),
+            (test_triangle_indices_valid, [gltf, indices]),
+            (test_no_degenerate_triangles, [indices]),
+            (test_mesh_topology, [gltf, indices]),
+        ]
+    except Exception as e:
+        load_error = str(e)
+    
     passed = 0
     failed = 0
     
-    for test_func, args in tests:
-        if test_func(*args):
-            passed += 1
-        else:
-            failed += 1
+    # The tests are independent; run them concurrently and report in order
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(_run_test, test_func, args) for test_func, args in tests]
+        for future in futures:
+            result, output = future.result()
+            sys.stdout.write(output)
+            if result:
+                passed += 1
+            else:
+                failed += 1
+    
+    if load_error is not None:
+        print_test("Mesh data loading")
+        print_fail(load_error)
+        failed += 1
     
-    # Run benchmarks
-    benchmark_generation()
+    # Run benchmarks only on request; compiling them dominates the run time
+    if args.bench:
+        benchmark_generation()
     
     # Summary
     print_header("Test Summary")